@@ -1,67 +1,408 @@
 # Necessary imports
+import hashlib
+import inspect
+import warnings
 import pandas as pd
-from scipy.stats import linregress
 import numpy as np
-from datetime import datetime
-import matplotlib.pyplot as plt
-import scipy.stats as stats
 
+# numba is optional, without it the kernels below are swapped for vectorized fallbacks
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+    prange = range
+    HAVE_NUMBA = False
+
+# bottleneck is optional, it provides C moving-window reductions
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+
+def _var_cvar(returns, level):
+    # Percentile position, linearly interpolated like np.percentile
+    pos = (returns.size - 1) * level / 100
+    lo = int(pos)
+    hi = min(lo + 1, returns.size - 1)
+
+    # Partition once around the order statistics bracketing the percentile
+    part = np.partition(returns, [lo, hi])
+
+    # Calculate historical VaR
+    var = part[lo] + (pos - lo) * (part[hi] - part[lo])
+
+    # Calculate historical CVaR as the mean of every return at or below VaR,
+    # which includes returns tied with VaR outside the partitioned tail
+    cvar = returns.mean(where=returns <= var)
+
+    return var, cvar
+
+
+def _information_ratio(mean, std):
+    # Annualized return over annualized volatility
+    return mean * 252 / (std * np.sqrt(252))
+
+
+# _omega, _moments and _maxdd are also built ahead of time by build_kernels.py, rerun it
+# after editing them (a build from other sources is ignored with a warning)
+@njit(cache=True, error_model='numpy')
+def _omega(returns, threshold):
+    # Accumulate returns above and below the threshold in a single pass
+    pos_sum = 0.0
+    pos_n = 0
+    neg_sum = 0.0
+    neg_n = 0
+    for r in returns:
+        if r > threshold:
+            pos_sum += r
+            pos_n += 1
+        else:
+            neg_sum += r
+            neg_n += 1
+
+    # Without returns on both sides the ratio is undefined
+    if pos_n == 0 or neg_n == 0:
+        return np.nan
+
+    # A zero mean below the threshold divides by zero, follow numpy's semantics
+    # explicitly since the ahead-of-time build raises on division by zero
+    if neg_sum == 0:
+        return np.sign(pos_sum) * np.inf if pos_sum != 0 else np.nan
+
+    # Calculate Omega ratio
+    return (pos_sum / pos_n) / abs(neg_sum / neg_n)
+
+
+@njit(cache=True, fastmath=True, error_model='numpy')
+def _moments(returns):
+    # Online central moments (Welford / Terriberry) in a single pass
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    m3 = 0.0
+    m4 = 0.0
+
+    # Online mean and sum of squares of the negative returns
+    neg_n = 0
+    neg_mean = 0.0
+    neg_m2 = 0.0
+
+    for r in returns:
+        n1 = n
+        n += 1
+        delta = r - mean
+        delta_n = delta / n
+        delta_n2 = delta_n * delta_n
+        term1 = delta * delta_n * n1
+        mean += delta_n
+        m4 += term1 * delta_n2 * (n * n - 3 * n + 3) + 6 * delta_n2 * m2 - 4 * delta_n * m3
+        m3 += term1 * delta_n * (n - 2) - 3 * delta_n * m2
+        m2 += term1
+
+        if r < 0:
+            neg_n += 1
+            neg_delta = r - neg_mean
+            neg_mean += neg_delta / neg_n
+            neg_m2 += neg_delta * (r - neg_mean)
+
+    # Sample standard deviation, biased skewness and excess kurtosis
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    skew = np.sqrt(n) * m3 / m2 ** 1.5 if m2 > 0 else np.nan
+    kurt = n * m4 / (m2 * m2) - 3.0 if m2 > 0 else np.nan
+
+    # Sample standard deviation of the negative returns
+    semi_dev = np.sqrt(neg_m2 / (neg_n - 1)) if neg_n > 1 else np.nan
+
+    return mean, std, skew, kurt, semi_dev
+
+
+@njit(cache=True, fastmath=True)
+def _maxdd(prices):
+    # Track the running max and the deepest drawdown in a single sweep
+    running_max = prices[0]
+    max_dd = 0.0
+    idx = 0
+    for k in range(prices.size):
+        p = prices[k]
+        if p > running_max:
+            running_max = p
+        dd = p / running_max - 1.0
+        if dd < max_dd:
+            max_dd = dd
+            idx = k
+
+    return max_dd, idx
+
+
+@njit(cache=True, error_model='numpy')
+def _rolling_std(returns, window):
+    n = returns.size
+    out = np.full(n, np.nan)
+    mean = 0.0
+    m2 = 0.0
+
+    # A sample standard deviation needs at least two observations
+    if window < 2:
+        return out
+
+    for k in range(n):
+        r = returns[k]
+        if k < window:
+            # Grow the window until it is full
+            delta = r - mean
+            mean += delta / (k + 1)
+            m2 += delta * (r - mean)
+        else:
+            # Slide the window by swapping the oldest return for the new one
+            old = returns[k - window]
+            new_mean = mean + (r - old) / window
+            m2 += (r - old) * (r - new_mean + old - mean)
+            mean = new_mean
+
+        # Sample standard deviation once the window is full
+        if k >= window - 1:
+            out[k] = np.sqrt(max(m2, 0.0) / (window - 1))
+
+    return out
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _rolling_std_table(table, window, out):
+    # One asset per row, so every series is contiguous and rows run on separate cores
+    for j in prange(table.shape[0]):
+        out[j] = _rolling_std(table[j], window)
+
+    return out
+
+
+# Kernels exported by build_kernels.py, captured before any fallback replaces them
+_AOT_KERNELS = (_maxdd, _omega, _moments)
+
+
+def _kernel_source_hash(kernels):
+    # Fingerprint of the kernel sources, to detect a stale ahead-of-time build
+    source = ''.join(inspect.getsource(getattr(kernel, 'py_func', kernel)) for kernel in kernels)
+    return int.from_bytes(hashlib.sha256(source.encode()).digest()[:8], 'little', signed=True)
+
+
+if not HAVE_NUMBA:
+    def _omega(returns, threshold):
+        # Count and sum each side through the mask instead of gathering the returns
+        mask = returns > threshold
+        pos_n = mask.sum()
+        neg_n = returns.size - pos_n
+
+        # Without returns on both sides the ratio is undefined
+        if pos_n == 0 or neg_n == 0:
+            return np.nan
+
+        pos_sum = np.where(mask, returns, 0.0).sum()
+        neg_sum = np.where(mask, 0.0, returns).sum()
 
-class RiskEngine:
+        # Calculate Omega ratio
+        return (pos_sum / pos_n) / abs(neg_sum / neg_n)
+
+    def _moments(returns):
+        n = returns.size
+        mean = returns.mean(dtype=np.float64)
+
+        # Central moments from the deviations around the mean
+        dev = returns - mean
+        dev2 = dev * dev
+        m2 = dev2.sum()
+        m3 = (dev2 * dev).sum()
+        m4 = (dev2 * dev2).sum()
+
+        # Sample standard deviation, biased skewness and excess kurtosis
+        std = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+        skew = np.sqrt(n) * m3 / m2 ** 1.5 if m2 > 0 else np.nan
+        kurt = n * m4 / (m2 * m2) - 3.0 if m2 > 0 else np.nan
+
+        # Sample standard deviation of the negative returns, from masked sums in float64
+        mask = returns < 0
+        neg_n = mask.sum()
+        if neg_n > 1:
+            negative_returns = np.where(mask, returns, np.float64(0.0))
+            neg_sum = negative_returns.sum()
+            neg_m2 = negative_returns @ negative_returns - neg_sum * neg_sum / neg_n
+            semi_dev = np.sqrt(neg_m2 / (neg_n - 1))
+        else:
+            semi_dev = np.nan
+
+        return mean, std, skew, kurt, semi_dev
+
+    def _maxdd(prices):
+        daily_dd = prices / np.maximum.accumulate(prices) - 1.0
+        idx = daily_dd.argmin()
+
+        return daily_dd[idx], idx
+
+    def _rolling_std_table(table, window, out):
+        # A sample standard deviation needs at least two observations, and a
+        # window longer than the series never fills
+        if window < 2 or window > table.shape[1]:
+            out[:] = np.nan
+        elif bn is not None:
+            out[:] = bn.move_std(table, window, min_count=window, axis=1, ddof=1)
+        else:
+            out[:] = pd.DataFrame(table.T).rolling(window).std().to_numpy().T
+
+        return out
+
+
+# Column types of the price file, so the CSV reader skips type inference
+_CSV_DTYPES = {
+    'Open': 'float64',
+    'High': 'float64',
+    'Low': 'float64',
+    'Close': 'float64',
+    'Adj Close': 'float64',
+    'Volume': 'int64',
+    'Dividends': 'float64',
+    'Stock Splits': 'float64',
+}
+
+
+# Prefer the ahead-of-time compiled kernels from build_kernels.py, which need no JIT warm-up
+try:
+    import risk_kernels
+except ImportError:
+    risk_kernels = None
+
+if risk_kernels is not None and risk_kernels.source_hash() != _kernel_source_hash(_AOT_KERNELS):
+    warnings.warn('risk_kernels was built from different kernel sources, rerun build_kernels.py; '
+                  'using the JIT kernels instead')
+    risk_kernels = None
+
+if risk_kernels is not None:
+    _maxdd = risk_kernels.maxdd
+    _omega = risk_kernels.omega
+    _moments = risk_kernels.moments
 
-    def __init__(self, file):
-        # Load the dataset
-        self.df = pd.read_csv(file)
 
-        # Format date column as datetime
-        self.df['date'] = pd.to_datetime(self.df['date'])
+class RiskEngine:
 
-        # Set date as index
-        self.df.set_index('date', inplace=True)
+    def __init__(self, file):
+        # Load the dataset with a typed schema, preferring the multi-threaded
+        # pyarrow reader when it is installed
+        try:
+            self.df = pd.read_csv(file, engine='pyarrow', dtype=_CSV_DTYPES, parse_dates=['date'], index_col=0)
+        except ImportError:
+            self.df = pd.read_csv(file, dtype=_CSV_DTYPES, parse_dates=['date'], index_col='date',
+                                  date_format='%Y-%m-%d')
+
+        # Keep the columns used by the metrics as contiguous arrays
+        self.prices = self.df['Adj Close'].to_numpy(np.float64)
+        self.dates = self.df.index.to_numpy()
+
+        # Returns per date range and dtype, shared between metrics
+        self._returns_cache = {}
+
+        # Prefix sums of log returns, so any range's total log return is one subtraction
+        self.cum_log = np.concatenate([[0.0], np.cumsum(np.log(self.prices[1:] / self.prices[:-1]))])
+
+    def _range_to_idx(self, start_date, end_date):
+        # A missing bound leaves that end of the range open, as with .loc
+        if start_date is None:
+            i = 0
+        else:
+            i = np.searchsorted(self.dates, np.datetime64(start_date), side='left')
+
+        # Partial dates such as '2020-12' cover their whole period, as with .loc
+        if end_date is None:
+            j = self.dates.size
+        else:
+            j = np.searchsorted(self.dates, np.datetime64(end_date) + 1, side='left')
+
+        return int(i), int(j)
+
+    def _get_returns(self, start_date, end_date, dtype=np.float64):
+        # Filter prices for the date range
+        i, j = self._range_to_idx(start_date, end_date)
+        prices = self.prices[i:j]
+
+        # Reuse the returns for this range if they were already computed, moving
+        # the entry to the back so the oldest lookup is evicted first
+        key = (i, j, np.dtype(dtype))
+        if key in self._returns_cache:
+            self._returns_cache[key] = self._returns_cache.pop(key)
+            return self._returns_cache[key]
+
+        # Calculate daily returns straight into an array of the requested dtype,
+        # dividing the price differences in place
+        returns = np.empty(max(prices.size - 1, 0), dtype)
+        np.subtract(prices[1:], prices[:-1], out=returns, casting='same_kind')
+        returns /= prices[:-1]
+
+        # Cached arrays are shared between metrics, so keep them read-only
+        prices.flags.writeable = False
+        returns.flags.writeable = False
+
+        # Keep the 32 most recently used ranges, dropping the least recently used
+        if len(self._returns_cache) >= 32:
+            del self._returns_cache[next(iter(self._returns_cache))]
+        self._returns_cache[key] = prices, returns
+
+        return prices, returns
 
     def annualized_performance(self, start_date, end_date):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate returns
-        data['return'] = data['Adj Close'].pct_change()
+        # Get the first and last price positions for the date range
+        i, j = self._range_to_idx(start_date, end_date)
+        last = j - 1
 
-        # Drop NaN values
-        data = data.dropna()
+        # At least two prices are needed for a single return
+        if last - i < 1:
+            raise ValueError('No returns between {} and {}'.format(start_date, end_date))
 
-        # Calculate the annualized performance
-        annualized_performance = np.prod(1 + data['return']) ** (252 / len(data)) - 1
+        # Calculate the annualized performance from the summed log returns
+        annualized_performance = np.expm1((self.cum_log[last] - self.cum_log[i]) * (252 / (last - i)))
 
         return annualized_performance
 
-    def max_drawdown(self, start_date, end_date, window):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
+    def max_drawdown(self, start_date, end_date, window=None):
+        # Filter prices for the date range, as a view on the stored array
+        i, j = self._range_to_idx(start_date, end_date)
+        prices = self.prices[i:j]
 
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
+        # Every drawdown path below needs at least one price
+        if prices.size == 0:
+            raise ValueError('No prices between {} and {}'.format(start_date, end_date))
 
-        # Calculate rolling max value
-        data['roll_max'] = data['Adj Close'].rolling(window, min_periods=1).max()
+        if window is None or window >= prices.size:
+            # Calculate max drawdown against the running max in one pass
+            max_dd, idx = _maxdd(prices)
+        else:
+            # Calculate rolling max value over the trailing window
+            if bn is not None:
+                roll_max = bn.move_max(prices, window, min_count=1)
+            else:
+                roll_max = pd.Series(prices).rolling(window, min_periods=1).max().to_numpy()
 
-        # Calculate daily drawdown
-        data['daily_dd'] = data['Adj Close'] / data['roll_max'] - 1.0
+            # Calculate daily drawdown
+            daily_dd = prices / roll_max - 1.0
 
-        # Calculate max drawdown
-        max_dd = data['daily_dd'].min()
+            # Calculate max drawdown
+            idx = daily_dd.argmin()
+            max_dd = daily_dd[idx]
 
         # Get the date of max drawdown
-        date_of_max_dd = data['daily_dd'].idxmin()
+        date_of_max_dd = pd.Timestamp(self.dates[i + idx])
 
         return max_dd, date_of_max_dd
 
     def plot_prices(self, start_date, end_date):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
+        # Filter prices for the date range, as views on the stored arrays
+        i, j = self._range_to_idx(start_date, end_date)
+
+        # Import matplotlib only when plotting, it is slow to load
+        import matplotlib.pyplot as plt
 
         # Create the plot
         plt.figure(figsize=(10,5))
-        plt.plot(data['Adj Close'])
+        plt.plot(self.dates[i:j], self.prices[i:j])
         plt.title('AAPL Adjusted Close Price')
         plt.xlabel('Date')
         plt.ylabel('Adjusted Close Price')
@@ -71,163 +412,121 @@ class RiskEngine:
 
 
     def plot_volatility(self, start_date, end_date, window=252):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
+        # Get daily returns for the date range, single precision is enough to plot
+        i, j = self._range_to_idx(start_date, end_date)
+        _, returns = self._get_returns(start_date, end_date, np.float32)
 
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
+        # Calculate rolling standard deviation, as a one-asset table
+        table = returns[np.newaxis, :]
+        volatility = _rolling_std_table(table, window, np.empty(table.shape))[0] * np.sqrt(252)
 
-        # Calculate rolling standard deviation
-        data['volatility'] = data['return'].rolling(window).std() * np.sqrt(252)
+        # Import matplotlib only when plotting, it is slow to load
+        import matplotlib.pyplot as plt
 
         # Create the plot
         plt.figure(figsize=(10,5))
-        plt.plot(data['volatility'])
+        plt.plot(self.dates[i + 1:j], volatility)
         plt.title('AAPL Rolling Volatility')
         plt.xlabel('Date')
         plt.ylabel('Volatility')
         plt.grid(True)
 
-    def information_ratio(self, start_date, end_date):
-        # Filter data for the date range
-        stock_data = self.df.loc[start_date:end_date].copy()
+    def summary_stats(self, start_date, end_date):
+        # Get daily returns for the date range
+        _, returns = self._get_returns(start_date, end_date)
 
-        # Calculate returns
-        stock_data['return'] = stock_data['Adj Close'].pct_change()
+        # Calculate all moment-based statistics in one pass
+        mean, std, skew, kurt, semi_dev = _moments(returns)
 
-        # Calculate annualized return
-        annual_return = stock_data['return'].mean() * 252
+        return {
+            'mean': mean,
+            'std': std,
+            'skewness': skew,
+            'kurtosis': kurt,
+            'semi_deviation': semi_dev,
+        }
 
-        # Calculate annualized volatility
-        annual_volatility = stock_data['return'].std() * np.sqrt(252)
+    def information_ratio(self, start_date, end_date):
+        stats = self.summary_stats(start_date, end_date)
 
         # Calculate the Information Ratio
-        information_ratio = annual_return / annual_volatility
+        information_ratio = _information_ratio(stats['mean'], stats['std'])
 
         return information_ratio
 
     def semi_deviation(self, start_date, end_date):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
+        return self.summary_stats(start_date, end_date)['semi_deviation']
 
-        # Filter negative returns
-        negative_returns = data['return'][data['return'] < 0]
+    def var_cvar(self, start_date, end_date, level=5):
+        # Get daily returns for the date range
+        _, returns = self._get_returns(start_date, end_date)
 
-        # Calculate semi-deviation
-        semi_dev = np.sqrt(negative_returns.var())
-
-        return semi_dev
+        # Calculate historical VaR and CVaR from a single partition
+        return _var_cvar(returns, level)
 
     def var_historical(self, start_date, end_date, level=5):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
-
-        # Drop any NaN values
-        data = data.dropna()
-
-        # Calculate historical VaR
-        var = np.percentile(data['return'], level)
+        var, _ = self.var_cvar(start_date, end_date, level)
 
         return var
 
     def cvar_historical(self, start_date, end_date, level=5):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
-
-        # Drop any NaN values
-        data = data.dropna()
-
-        # Calculate historical VaR
-        var = np.percentile(data['return'], level)
-
-        # Calculate historical CVaR
-        cvar = data['return'][data['return'] <= var].mean()
+        _, cvar = self.var_cvar(start_date, end_date, level)
 
         return cvar
 
     def skewness(self, start_date, end_date):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
-
-        # Drop any NaN values
-        data = data.dropna()
-
-        # Calculate skewness
-        skewness = stats.skew(data['return'])
-
-        return skewness
+        return self.summary_stats(start_date, end_date)['skewness']
 
     def kurtosis(self, start_date, end_date):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
-
-        # Drop any NaN values
-        data = data.dropna()
-
-        # Calculate kurtosis
-        kurtosis = stats.kurtosis(data['return'])
-
-        return kurtosis
+        return self.summary_stats(start_date, end_date)['kurtosis']
 
     def omega_ratio(self, start_date, end_date, threshold=0):
-        # Filter data for the date range
-        data = self.df.loc[start_date:end_date].copy()
-
-        # Calculate daily returns
-        data['return'] = data['Adj Close'].pct_change()
-
-        # Drop any NaN values
-        data = data.dropna()
-
-        # Separate returns above and below the threshold
-        returns_above_threshold = data['return'][data['return'] > threshold]
-        returns_below_threshold = data['return'][data['return'] <= threshold]
+        # Get daily returns for the date range
+        _, returns = self._get_returns(start_date, end_date)
 
         # Calculate Omega ratio
-        omega_ratio = returns_above_threshold.mean() / abs(returns_below_threshold.mean())
+        omega_ratio = _omega(returns, threshold)
 
         return omega_ratio
 
+    def summary(self, start_date, end_date, window=None, level=5, threshold=0):
+        # Every metric reads the same cached returns, so the range is only sliced once
+        stats = self.summary_stats(start_date, end_date)
+        var, cvar = self.var_cvar(start_date, end_date, level)
+        max_dd, date_of_max_dd = self.max_drawdown(start_date, end_date, window)
+
+        return {
+            'annualized_performance': self.annualized_performance(start_date, end_date),
+            'max_drawdown': max_dd,
+            'date_of_max_drawdown': date_of_max_dd,
+            'information_ratio': _information_ratio(stats['mean'], stats['std']),
+            'semi_deviation': stats['semi_deviation'],
+            'var_historical': var,
+            'cvar_historical': cvar,
+            'skewness': stats['skewness'],
+            'kurtosis': stats['kurtosis'],
+            'omega_ratio': self.omega_ratio(start_date, end_date, threshold),
+        }
+
 
 # Usage
 if __name__ == "__main__":
     risk_engine = RiskEngine('apple.csv')
     start_date = '2010-01-01'
     end_date = '2020-12-31'
+    summary = risk_engine.summary(start_date, end_date, window=252)
     print("Annualized performance from {} to {}: {:.2%}".format(start_date, end_date,
-                                                                risk_engine.annualized_performance(start_date,
-                                                                                                   end_date)))
-    max_dd, date_of_max_dd = risk_engine.max_drawdown(start_date, end_date, 252)
-    print("Maximum drawdown from {} to {}: {:.2%} occurred on {}".format(start_date, end_date, max_dd,
-                                                                         date_of_max_dd.date()))
-    print("Information ratio from {} to {}: {:.2f}".format(start_date, end_date,
-                                                           risk_engine.information_ratio(start_date, end_date)))
+                                                                summary['annualized_performance']))
+    print("Maximum drawdown from {} to {}: {:.2%} occurred on {}".format(start_date, end_date,
+                                                                         summary['max_drawdown'],
+                                                                         summary['date_of_max_drawdown'].date()))
+    print("Information ratio from {} to {}: {:.2f}".format(start_date, end_date, summary['information_ratio']))
     risk_engine.plot_prices(start_date, end_date)
     risk_engine.plot_volatility(start_date, end_date)
-    print("Semi-deviation from {} to {}: {:.2f}".format(start_date, end_date,
-                                                        risk_engine.semi_deviation(start_date, end_date)))
-    print("Historical VaR at 5% level from {} to {}: {:.2f}".format(start_date, end_date,
-                                                                    risk_engine.var_historical(start_date, end_date)))
+    print("Semi-deviation from {} to {}: {:.2f}".format(start_date, end_date, summary['semi_deviation']))
+    print("Historical VaR at 5% level from {} to {}: {:.2f}".format(start_date, end_date, summary['var_historical']))
     print("Historical CVaR at 5% level from {} to {}: {:.2f}".format(start_date, end_date,
-                                                                     risk_engine.cvar_historical(start_date, end_date)))
-    print("Skewness from {} to {}: {:.2f}".format(start_date, end_date,
-                                                  risk_engine.skewness(start_date, end_date)))
-    print("Kurtosis from {} to {}: {:.2f}".format(start_date, end_date,
-                                                  risk_engine.kurtosis(start_date, end_date)))
-    print("Omega ratio from {} to {}: {:.2f}".format(start_date, end_date,
-                                                     risk_engine.omega_ratio(start_date, end_date)))
\ No newline at end of file
+                                                                     summary['cvar_historical']))
+    print("Skewness from {} to {}: {:.2f}".format(start_date, end_date, summary['skewness']))
+    print("Kurtosis from {} to {}: {:.2f}".format(start_date, end_date, summary['kurtosis']))
+    print("Omega ratio from {} to {}: {:.2f}".format(start_date, end_date, summary['omega_ratio']))
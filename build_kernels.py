@@ -0,0 +1,32 @@
+# Ahead-of-time build of the numba kernels in app.py, run with `python build_kernels.py`.
+# This writes the risk_kernels extension module next to app.py, which app.py picks up on
+# import instead of compiling the same kernels on first use.
+import os
+import sys
+
+from numba.pycc import CC
+
+# Make sure app.py exposes its JIT kernels rather than a previous build of this module
+sys.modules['risk_kernels'] = None
+import app
+
+cc = CC('risk_kernels')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+# Record the kernel sources this build came from, app.py ignores the build once they change
+SOURCE_HASH = app._kernel_source_hash(app._AOT_KERNELS)
+
+
+def source_hash():
+    return SOURCE_HASH
+
+
+cc.export('source_hash', 'i8()')(source_hash)
+cc.export('maxdd', 'Tuple((f8, i8))(f8[:])')(app._maxdd.py_func)
+cc.export('omega', 'f8(f8[:], f8)')(app._omega.py_func)
+cc.export('moments', 'UniTuple(f8, 5)(f8[:])')(app._moments.py_func)
+
+# The rolling volatility kernels stay JIT compiled, pycc cannot build parallel (prange) code
+
+if __name__ == '__main__':
+    cc.compile()